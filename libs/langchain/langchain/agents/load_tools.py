@@ -462,7 +462,8 @@ def load_tools(
             raise ValueError(f"Got unknown tool {name}")
     if callbacks is not None:
         for tool in tools:
-            tool.callbacks = callbacks
+            # Tools are immutable (allow_mutation=False), so bypass pydantic.
+            object.__setattr__(tool, "callbacks", callbacks)
     return tools
 
 
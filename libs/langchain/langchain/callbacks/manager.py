@@ -80,6 +80,21 @@ def _get_debug() -> bool:
     return langchain.debug
 
 
+def _global_handlers_enabled() -> bool:
+    """Check whether any global callback handlers (debug or tracing) are active."""
+    return (
+        _get_debug()
+        or openai_callback_var.get() is not None
+        or tracing_callback_var.get() is not None
+        or wandb_tracing_callback_var.get() is not None
+        or tracing_v2_callback_var.get() is not None
+        or env_var_is_set("LANGCHAIN_TRACING")
+        or env_var_is_set("LANGCHAIN_HANDLER")
+        or env_var_is_set("LANGCHAIN_WANDB_TRACING")
+        or env_var_is_set("LANGCHAIN_TRACING_V2")
+    )
+
+
 @contextmanager
 def get_openai_callback() -> Generator[OpenAICallbackHandler, None, None]:
     """Get the OpenAI callback handler in a context manager.
@@ -15,19 +15,40 @@
     Document
 """  # noqa: E501
 
-from langchain.document_transformers.doctran_text_extract import (
-    DoctranPropertyExtractor,
-)
-from langchain.document_transformers.doctran_text_qa import DoctranQATransformer
-from langchain.document_transformers.doctran_text_translate import DoctranTextTranslator
-from langchain.document_transformers.embeddings_redundant_filter import (
-    EmbeddingsClusteringFilter,
-    EmbeddingsRedundantFilter,
-    get_stateful_documents,
-)
-from langchain.document_transformers.html2text import Html2TextTransformer
-from langchain.document_transformers.long_context_reorder import LongContextReorder
-from langchain.document_transformers.openai_functions import OpenAIMetadataTagger
+import importlib
+from typing import Any
+
+# Transformers are imported lazily: several of them pull in heavy optional
+# dependencies and large pydantic model hierarchies, so eagerly importing
+# all of them makes `import langchain.document_transformers` pay for
+# transformers that are never used.
+_LAZY_IMPORTS = {
+    "DoctranPropertyExtractor": "langchain.document_transformers.doctran_text_extract",
+    "DoctranQATransformer": "langchain.document_transformers.doctran_text_qa",
+    "DoctranTextTranslator": "langchain.document_transformers.doctran_text_translate",
+    "EmbeddingsClusteringFilter": (
+        "langchain.document_transformers.embeddings_redundant_filter"
+    ),
+    "EmbeddingsRedundantFilter": (
+        "langchain.document_transformers.embeddings_redundant_filter"
+    ),
+    "get_stateful_documents": (
+        "langchain.document_transformers.embeddings_redundant_filter"
+    ),
+    "Html2TextTransformer": "langchain.document_transformers.html2text",
+    "LongContextReorder": "langchain.document_transformers.long_context_reorder",
+    "OpenAIMetadataTagger": "langchain.document_transformers.openai_functions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name])
+        attr = getattr(module, name)
+        globals()[name] = attr
+        return attr
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "DoctranQATransformer",
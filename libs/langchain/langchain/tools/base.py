@@ -5,16 +5,29 @@ import asyncio
 import warnings
 from abc import abstractmethod
 from functools import partial
-from inspect import signature
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type, Union
+from inspect import Parameter, signature
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_type_hints,
+)
+from weakref import WeakKeyDictionary
 
 from pydantic import (
     BaseModel,
     Extra,
     Field,
+    PrivateAttr,
     create_model,
     root_validator,
-    validate_arguments,
 )
 from pydantic.main import ModelMetaclass
 
@@ -25,9 +38,19 @@ from langchain.callbacks.manager import (
     CallbackManager,
     CallbackManagerForToolRun,
     Callbacks,
+    _global_handlers_enabled,
 )
 from langchain.schema.runnable import Runnable, RunnableConfig
 
+# Tools may be constructed per-request in agent loops, so only emit the
+# callback_manager deprecation warning once per process.
+_WARNED_CALLBACK_MANAGER = False
+
+# Reusable no-op run managers for tool calls with no callbacks configured,
+# avoiding a manager construction per call on the hot path.
+_NOOP_RUN_MANAGER = CallbackManagerForToolRun.get_noop_manager()
+_NOOP_ASYNC_RUN_MANAGER = AsyncCallbackManagerForToolRun.get_noop_manager()
+
 
 class SchemaAnnotationError(TypeError):
     """Raised when 'args_schema' is missing or has an incorrect type annotation."""
@@ -64,35 +87,110 @@ class ChildTool(BaseTool):
                     f"{typehint_mandate}"
                 )
         # Pass through to Pydantic's metaclass
-        return super().__new__(cls, name, bases, dct)
+        new_cls = super().__new__(cls, name, bases, dct)
+        # Precompute invariant introspection of the run methods at class
+        # definition time so dispatch is a plain attribute read at runtime.
+        run_func = getattr(new_cls, "_run", None)
+        if run_func is not None:
+            new_cls._run_accepts_run_manager = _accepts_run_manager(run_func)
+        arun_func = getattr(new_cls, "_arun", None)
+        if arun_func is not None:
+            new_cls._arun_accepts_run_manager = _accepts_run_manager(arun_func)
+        return new_cls
+
+
+def _get_schema_properties(args_schema: Type[BaseModel]) -> dict:
+    """Get the schema properties of an args_schema class, caching the result.
+
+    The result is stashed on the schema class itself rather than in a
+    module-level cache so that schema classes minted per request
+    (e.g. by StructuredTool.from_function) stay garbage-collectable.
+    """
+    properties = args_schema.__dict__.get("_cached_schema_properties")
+    if properties is None:
+        properties = args_schema.schema()["properties"]
+        args_schema._cached_schema_properties = properties  # type: ignore
+    return properties
+
+
+def _get_first_field_name(args_schema: Type[BaseModel]) -> str:
+    """Get the name of the first field declared on an args_schema class."""
+    name = args_schema.__dict__.get("_cached_first_field_name")
+    if name is None:
+        name = next(iter(args_schema.__fields__))
+        args_schema._cached_first_field_name = name  # type: ignore
+    return name
+
+
+def _is_single_input(args_schema: Type[BaseModel]) -> bool:
+    """Check whether an args_schema describes a single-input tool."""
+    single = args_schema.__dict__.get("_cached_is_single_input")
+    if single is None:
+        keys = {k for k in _get_schema_properties(args_schema) if k != "kwargs"}
+        single = len(keys) == 1
+        args_schema._cached_is_single_input = single  # type: ignore
+    return single
+
+
+_inferred_schema_cache: "WeakKeyDictionary[Callable, Dict[str, Type[BaseModel]]]" = (
+    WeakKeyDictionary()
+)
 
 
-def _create_subset_model(
-    name: str, model: BaseModel, field_names: list
-) -> Type[BaseModel]:
-    """Create a pydantic model with only a subset of model's fields."""
-    fields = {}
-    for field_name in field_names:
-        field = model.__fields__[field_name]
-        fields[field_name] = (field.outer_type_, field.field_info)
-    return create_model(name, **fields)  # type: ignore
+def _infer_args_schema(model_name: str, func: Callable) -> Type[BaseModel]:
+    """Infer an args_schema from a _run signature, caching per tool class.
 
+    Keyed weakly on the function so dynamically created tool classes stay
+    garbage-collectable.
+    """
+    try:
+        schemas = _inferred_schema_cache.setdefault(func, {})
+    except TypeError:
+        # func does not support weak references; skip caching.
+        return create_schema_from_function(model_name, func)
+    schema = schemas.get(model_name)
+    if schema is None:
+        schema = create_schema_from_function(model_name, func)
+        schemas[model_name] = schema
+    return schema
 
-def _get_filtered_args(
-    inferred_model: Type[BaseModel],
-    func: Callable,
-) -> dict:
-    """Get the arguments from a function's signature."""
-    schema = inferred_model.schema()["properties"]
-    valid_keys = signature(func).parameters
-    return {k: schema[k] for k in valid_keys if k not in ("run_manager", "callbacks")}
+
+_accepts_run_manager_cache: "WeakKeyDictionary[Callable, bool]" = WeakKeyDictionary()
+_accepts_callbacks_cache: "WeakKeyDictionary[Callable, bool]" = WeakKeyDictionary()
 
 
-class _SchemaConfig:
-    """Configuration for the pydantic model."""
+def _accepts_run_manager(func: Callable) -> bool:
+    """Check whether a callable accepts a run_manager argument, caching the result.
 
-    extra = Extra.forbid
-    arbitrary_types_allowed = True
+    inspect.signature is expensive, and the answer never changes for a given
+    callable, so avoid re-introspecting it on every tool invocation.
+    """
+    try:
+        accepts = _accepts_run_manager_cache.get(func)
+    except TypeError:
+        # func does not support weak references; skip caching.
+        return signature(func).parameters.get("run_manager") is not None
+    if accepts is None:
+        accepts = signature(func).parameters.get("run_manager") is not None
+        _accepts_run_manager_cache[func] = accepts
+    return accepts
+
+
+def _accepts_callbacks(func: Callable) -> bool:
+    """Check whether a callable accepts a callbacks argument, caching the result.
+
+    Many tools can wrap the same callable, so the probe is shared across
+    instances rather than repeated on every invocation.
+    """
+    try:
+        accepts = _accepts_callbacks_cache.get(func)
+    except TypeError:
+        # func does not support weak references; skip caching.
+        return signature(func).parameters.get("callbacks") is not None
+    if accepts is None:
+        accepts = signature(func).parameters.get("callbacks") is not None
+        _accepts_callbacks_cache[func] = accepts
+    return accepts
 
 
 def create_schema_from_function(
@@ -106,18 +204,30 @@ def create_schema_from_function(
     Returns:
         A pydantic model with the same arguments as the function
     """
-    # https://docs.pydantic.dev/latest/usage/validation_decorator/
-    validated = validate_arguments(func, config=_SchemaConfig)  # type: ignore
-    inferred_model = validated.model  # type: ignore
-    if "run_manager" in inferred_model.__fields__:
-        del inferred_model.__fields__["run_manager"]
-    if "callbacks" in inferred_model.__fields__:
-        del inferred_model.__fields__["callbacks"]
-    # Pydantic adds placeholder virtual fields we need to strip
-    valid_properties = _get_filtered_args(inferred_model, func)
-    return _create_subset_model(
-        f"{model_name}Schema", inferred_model, list(valid_properties)
-    )
+    try:
+        # Resolve string annotations (e.g. under
+        # `from __future__ import annotations`) to real types.
+        hints = get_type_hints(func)
+    except (NameError, TypeError):
+        hints = {}
+    fields: Dict[str, Tuple[Any, Any]] = {}
+    for param_name, param in signature(func).parameters.items():
+        if param_name in ("self", "cls", "run_manager", "callbacks"):
+            continue
+        annotation = hints.get(param_name)
+        if annotation is None:
+            annotation = (
+                Any if param.annotation is Parameter.empty else param.annotation
+            )
+        if param.kind is Parameter.VAR_POSITIONAL:
+            fields[param_name] = (Tuple[annotation, ...], None)
+        elif param.kind is Parameter.VAR_KEYWORD:
+            fields[param_name] = (Dict[str, annotation], None)  # type: ignore
+        elif param.default is Parameter.empty:
+            fields[param_name] = (annotation, ...)
+        else:
+            fields[param_name] = (annotation, param.default)
+    return create_model(f"{model_name}Schema", **fields)  # type: ignore
 
 
 class ToolException(Exception):
@@ -151,6 +261,13 @@ class BaseTool(BaseModel, Runnable[Union[str, Dict], Any], metaclass=ToolMetacla
     """
     verbose: bool = False
     """Whether to log the tool's progress."""
+    skip_validation: bool = False
+    """Whether to skip validating tool input against the args_schema.
+
+    Only set this to True when inputs are already validated upstream;
+    the input is then passed through pydantic's construct() without
+    any validation or coercion.
+    """
 
     callbacks: Callbacks = Field(default=None, exclude=True)
     """Callbacks to be called during tool execution."""
@@ -174,25 +291,35 @@ class BaseTool(BaseModel, Runnable[Union[str, Dict], Any], metaclass=ToolMetacla
     ] = False
     """Handle the content of the ToolException thrown."""
 
+    _serialized: Optional[Dict[str, str]] = PrivateAttr(default=None)
+    """Invariant descriptor dict passed to on_tool_start, built on first use."""
+
+    # Overwritten per class by ToolMetaclass from the _run/_arun signatures.
+    _run_accepts_run_manager: ClassVar[bool] = False
+    _arun_accepts_run_manager: ClassVar[bool] = False
+
     class Config:
         """Configuration for this pydantic object."""
 
         extra = Extra.forbid
         arbitrary_types_allowed = True
+        allow_mutation = False
 
     @property
     def is_single_input(self) -> bool:
         """Whether the tool only accepts a single input."""
+        if self.args_schema is not None:
+            return _is_single_input(self.args_schema)
         keys = {k for k in self.args if k != "kwargs"}
         return len(keys) == 1
 
     @property
     def args(self) -> dict:
         if self.args_schema is not None:
-            return self.args_schema.schema()["properties"]
+            return _get_schema_properties(self.args_schema)
         else:
-            schema = create_schema_from_function(self.name, self._run)
-            return schema.schema()["properties"]
+            schema = _infer_args_schema(self.name, type(self)._run)
+            return _get_schema_properties(schema)
 
     # --- Runnable ---
 
@@ -227,24 +354,57 @@ class BaseTool(BaseModel, Runnable[Union[str, Dict], Any], metaclass=ToolMetacla
         """Convert tool input to pydantic model."""
         input_args = self.args_schema
         if isinstance(tool_input, str):
-            if input_args is not None:
-                key_ = next(iter(input_args.__fields__.keys()))
+            if input_args is not None and not self.skip_validation:
+                key_ = _get_first_field_name(input_args)
                 input_args.validate({key_: tool_input})
             return tool_input
         else:
             if input_args is not None:
-                result = input_args.parse_obj(tool_input)
+                if self.skip_validation:
+                    result = input_args.construct(**tool_input)
+                else:
+                    result = input_args.parse_obj(tool_input)
                 return {k: v for k, v in result.dict().items() if k in tool_input}
         return tool_input
 
+    def _get_serialized(self) -> Dict[str, str]:
+        """Get the descriptor dict for on_tool_start, building it once."""
+        serialized = self._serialized
+        if serialized is None:
+            serialized = {"name": self.name, "description": self.description}
+            self._serialized = serialized
+        return serialized
+
+    def _can_use_noop_manager(
+        self,
+        callbacks: Callbacks,
+        verbose: bool,
+        tags: Optional[List[str]],
+        metadata: Optional[Dict[str, Any]],
+    ) -> bool:
+        """Whether a run can skip callback manager construction entirely."""
+        return (
+            callbacks is None
+            and self.callbacks is None
+            and tags is None
+            and self.tags is None
+            and metadata is None
+            and self.metadata is None
+            and not verbose
+            and not _global_handlers_enabled()
+        )
+
     @root_validator()
     def raise_deprecation(cls, values: Dict) -> Dict:
         """Raise deprecation warning if callback_manager is used."""
         if values.get("callback_manager") is not None:
-            warnings.warn(
-                "callback_manager is deprecated. Please use callbacks instead.",
-                DeprecationWarning,
-            )
+            global _WARNED_CALLBACK_MANAGER
+            if not _WARNED_CALLBACK_MANAGER:
+                _WARNED_CALLBACK_MANAGER = True
+                warnings.warn(
+                    "callback_manager is deprecated. Please use callbacks instead.",
+                    DeprecationWarning,
+                )
             values["callbacks"] = values.pop("callback_manager", None)
         return values
 
@@ -298,23 +458,30 @@ class BaseTool(BaseModel, Runnable[Union[str, Dict], Any], metaclass=ToolMetacla
             verbose_ = verbose
         else:
             verbose_ = self.verbose
-        callback_manager = CallbackManager.configure(
-            callbacks,
-            self.callbacks,
-            verbose_,
-            tags,
-            self.tags,
-            metadata,
-            self.metadata,
-        )
         # TODO: maybe also pass through run_manager is _run supports kwargs
-        new_arg_supported = signature(self._run).parameters.get("run_manager")
-        run_manager = callback_manager.on_tool_start(
-            {"name": self.name, "description": self.description},
-            tool_input if isinstance(tool_input, str) else str(tool_input),
-            color=start_color,
-            **kwargs,
-        )
+        new_arg_supported = self._run_accepts_run_manager
+        if self._can_use_noop_manager(callbacks, verbose_, tags, metadata):
+            run_manager = _NOOP_RUN_MANAGER
+        else:
+            callback_manager = CallbackManager.configure(
+                callbacks,
+                self.callbacks,
+                verbose_,
+                tags,
+                self.tags,
+                metadata,
+                self.metadata,
+            )
+            # Only materialize the input repr when a handler will see it.
+            serialized_input = (
+                tool_input if isinstance(tool_input, str) else str(tool_input)
+            )
+            run_manager = callback_manager.on_tool_start(
+                self._get_serialized(),
+                serialized_input,
+                color=start_color,
+                **kwargs,
+            )
         try:
             tool_args, tool_kwargs = self._to_args_and_kwargs(parsed_input)
             observation = (
@@ -371,22 +538,29 @@ class BaseTool(BaseModel, Runnable[Union[str, Dict], Any], metaclass=ToolMetacla
             verbose_ = verbose
         else:
             verbose_ = self.verbose
-        callback_manager = AsyncCallbackManager.configure(
-            callbacks,
-            self.callbacks,
-            verbose_,
-            tags,
-            self.tags,
-            metadata,
-            self.metadata,
-        )
-        new_arg_supported = signature(self._arun).parameters.get("run_manager")
-        run_manager = await callback_manager.on_tool_start(
-            {"name": self.name, "description": self.description},
-            tool_input if isinstance(tool_input, str) else str(tool_input),
-            color=start_color,
-            **kwargs,
-        )
+        new_arg_supported = self._arun_accepts_run_manager
+        if self._can_use_noop_manager(callbacks, verbose_, tags, metadata):
+            run_manager = _NOOP_ASYNC_RUN_MANAGER
+        else:
+            callback_manager = AsyncCallbackManager.configure(
+                callbacks,
+                self.callbacks,
+                verbose_,
+                tags,
+                self.tags,
+                metadata,
+                self.metadata,
+            )
+            # Only materialize the input repr when a handler will see it.
+            serialized_input = (
+                tool_input if isinstance(tool_input, str) else str(tool_input)
+            )
+            run_manager = await callback_manager.on_tool_start(
+                self._get_serialized(),
+                serialized_input,
+                color=start_color,
+                **kwargs,
+            )
         try:
             # We then call the tool on the tool input to get an observation
             tool_args, tool_kwargs = self._to_args_and_kwargs(parsed_input)
@@ -462,7 +636,7 @@ class Tool(BaseTool):
     def args(self) -> dict:
         """The tool's input arguments."""
         if self.args_schema is not None:
-            return self.args_schema.schema()["properties"]
+            return _get_schema_properties(self.args_schema)
         # For backwards compatibility, if the function signature is ambiguous,
         # assume it takes a single string input.
         return {"tool_input": {"type": "string"}}
@@ -486,7 +660,7 @@ class Tool(BaseTool):
         **kwargs: Any,
     ) -> Any:
         """Use the tool."""
-        new_argument_supported = signature(self.func).parameters.get("callbacks")
+        new_argument_supported = _accepts_callbacks(self.func)
         return (
             self.func(
                 *args,
@@ -505,9 +679,7 @@ class Tool(BaseTool):
     ) -> Any:
         """Use the tool asynchronously."""
         if self.coroutine:
-            new_argument_supported = signature(self.coroutine).parameters.get(
-                "callbacks"
-            )
+            new_argument_supported = _accepts_callbacks(self.coroutine)
             return (
                 await self.coroutine(
                     *args,
@@ -581,7 +753,7 @@ class StructuredTool(BaseTool):
     @property
     def args(self) -> dict:
         """The tool's input arguments."""
-        return self.args_schema.schema()["properties"]
+        return _get_schema_properties(self.args_schema)
 
     def _run(
         self,
@@ -590,7 +762,7 @@ class StructuredTool(BaseTool):
         **kwargs: Any,
     ) -> Any:
         """Use the tool."""
-        new_argument_supported = signature(self.func).parameters.get("callbacks")
+        new_argument_supported = _accepts_callbacks(self.func)
         return (
             self.func(
                 *args,
@@ -609,9 +781,7 @@ class StructuredTool(BaseTool):
     ) -> str:
         """Use the tool asynchronously."""
         if self.coroutine:
-            new_argument_supported = signature(self.coroutine).parameters.get(
-                "callbacks"
-            )
+            new_argument_supported = _accepts_callbacks(self.coroutine)
             return (
                 await self.coroutine(
                     *args,
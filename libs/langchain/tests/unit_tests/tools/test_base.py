@@ -1,5 +1,7 @@
 """Test the base tool implementation."""
+import gc
 import json
+import weakref
 from datetime import datetime
 from enum import Enum
 from functools import partial
@@ -64,6 +66,48 @@ def test_structured_args() -> None:
     assert structured_api.run(args) == expected_result
 
 
+def test_structured_args_skip_validation() -> None:
+    """Test that skip_validation bypasses the args_schema."""
+    structured_api = _MockStructuredTool(skip_validation=True)
+    expected_result = "1 True {'foo': 'bar'}"
+    args = {"arg1": 1, "arg2": True, "arg3": {"foo": "bar"}}
+    assert structured_api.run(args) == expected_result
+    # Invalid input is passed through untouched instead of raising.
+    assert structured_api.run({"arg1": 1, "arg2": "not a bool"}) == "1 not a bool None"
+
+
+def test_structured_tool_from_function_string_annotations() -> None:
+    """Test that string annotations are resolved when inferring a schema."""
+
+    def foo(bar: "int", baz: "_MockSchema") -> str:
+        """Docstring."""
+        raise NotImplementedError()
+
+    structured_tool = StructuredTool.from_function(foo)
+    assert not structured_tool.is_single_input
+    assert structured_tool.args == {
+        "bar": {"title": "Bar", "type": "integer"},
+        "baz": {"$ref": "#/definitions/_MockSchema"},
+    }
+
+
+def test_inferred_schema_classes_are_collectable() -> None:
+    """Test per-tool schema classes are not pinned by the module-level caches."""
+
+    def foo(bar: int) -> str:
+        """Docstring."""
+        return str(bar)
+
+    structured_tool = StructuredTool.from_function(foo)
+    assert structured_tool.run({"bar": 1}) == "1"
+    assert structured_tool.is_single_input
+    assert structured_tool.args_schema is not None
+    schema_ref = weakref.ref(structured_tool.args_schema)
+    del structured_tool
+    gc.collect()
+    assert schema_ref() is None
+
+
 def test_unannotated_base_tool_raises_error() -> None:
     """Test that a BaseTool without type hints raises an exception.""" ""
     with pytest.raises(SchemaAnnotationError):